@@ -1,10 +1,8 @@
 import asyncio
-import functools
 import logging
 import random
 import re
-from asyncio import gather
-from typing import List, Coroutine, Any, Tuple, Optional
+from typing import Callable, List, Coroutine, Any, Sequence, Tuple, Optional
 
 from app.config import DEFAULT_TOPICS, GERMAN_HOME_TOPICS
 from app.data_providers.corpus.corpus_feature_group_client import CorpusFeatureGroupClient
@@ -35,21 +33,79 @@ from app.rankers.algorithms import unique_domains_first
 from app.data_providers.slate_providers.new_tab_slate_provider import NewTabSlateProvider
 
 
-def _empty_on_error(func):
-    """ Fallback to empty recommendations if Qdrant error occurred """
-    @functools.wraps(func)
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except QdrantError:
-            return []
-    return wrapper
+def _discard_task(task: asyncio.Task) -> None:
+    """ Cancel a speculative task that is no longer needed, retrieving its exception if it already failed """
+    if not task.cancel() and not task.cancelled():
+        task.exception()
+
+
+async def _await_all(tasks: Sequence['asyncio.Task']) -> List:
+    """
+    Await pre-created tasks in order and return their results, like asyncio.gather but without its per-child
+    future and callback machinery. If an await raises, the not-yet-consumed tasks are discarded so their work does
+    not keep running after the error and their failures don't emit 'exception was never retrieved' warnings.
+    """
+    results = []
+    try:
+        for task in tasks:
+            results.append(await task)
+    except BaseException:
+        # tasks[len(results)] raised and was consumed by the await above; discard the ones after it.
+        for task in tasks[len(results) + 1:]:
+            _discard_task(task)
+        raise
+    return results
 
 
 class Item2ItemDispatch:
+    # How long the primary request may run before its fallback fetch is speculatively started. Healthy requests
+    # finish well within this, so they never pay for (or log) a fallback fetch.
+    FALLBACK_HEDGE_SECONDS = 0.05
+
     def __init__(self, item_recommender: Item2ItemRecommender):
         self.item_recommender = item_recommender
 
+    async def _fetch_with_hedged_fallback(
+            self,
+            primary: Coroutine,
+            fallback_factory: Callable[[], Coroutine],
+    ) -> Tuple[List, bool]:
+        """
+        Await the primary recommender request, hedged by the fallback fetch.
+
+        The fallback is started speculatively once the primary has been running for FALLBACK_HEDGE_SECONDS, so a
+        slow failure doesn't pay for both fetches back-to-back, while requests that complete within the hedge delay
+        cost no extra Qdrant traffic. A fallback that is no longer needed is discarded before it is awaited.
+
+        :param primary: Coroutine for the primary recommendation fetch.
+        :param fallback_factory: Called without arguments to create the fallback fetch coroutine.
+        :return: (recs, used_fallback). A QdrantError from the fallback is downgraded to an empty list;
+            UnsupportedLanguage from the primary propagates to the caller.
+        """
+        primary_task = asyncio.ensure_future(primary)
+        fallback = None
+        try:
+            try:
+                return await asyncio.wait_for(asyncio.shield(primary_task), timeout=self.FALLBACK_HEDGE_SECONDS), False
+            except asyncio.TimeoutError:
+                # The primary is slow and may be about to fail: warm up the fallback while continuing to wait.
+                fallback = asyncio.ensure_future(fallback_factory())
+                return await primary_task, False
+        except UnsupportedLanguage:
+            raise
+        except Item2ItemError:
+            if fallback is None:
+                fallback = asyncio.ensure_future(fallback_factory())
+            fallback_task, fallback = fallback, None
+            try:
+                return await fallback_task, True
+            except QdrantError:
+                # Fall back to empty recommendations if the fallback fetch failed too.
+                return [], True
+        finally:
+            if fallback is not None:
+                _discard_task(fallback)
+
     async def after_save(self,
                          resolved_id: int,
                          lang: str,
@@ -61,53 +117,57 @@ class Item2ItemDispatch:
             recs = []
         return self._to_corpus_items(recs, count)
 
-    @_empty_on_error
     async def after_article(self,
                             resolved_id: int,
                             lang: str,
                             count: int) -> List[CorpusRecommendationModel]:
         try:
             # request more to apply domain diversification
-            recs = await self.item_recommender.related(resolved_id, count=20, lang=lang)
+            # fallback to frequently saved for "You Might Also Like"
+            recs, used_fallback = await self._fetch_with_hedged_fallback(
+                self.item_recommender.related(resolved_id, count=20, lang=lang),
+                lambda: self.item_recommender.frequently_saved_curated(count=100))
         except UnsupportedLanguage:
             # do not fallback for unsupported language
             return []
-        except Item2ItemError:
-            # fallback to frequently saved for "You Might Also Like"
-            recs = await self.item_recommender.frequently_saved_curated(count=100)
+        if used_fallback:
             random.shuffle(recs)
         recs = unique_domains_first(recs)
         return self._to_corpus_items(recs, count)
 
-    @_empty_on_error
     async def syndicated(self, resolved_id: int, count: int) -> List[CorpusRecommendationModel]:
-        try:
-            # request more to apply domain diversification
-            recs = await self.item_recommender.syndicated(resolved_id, 20)
-        except Item2ItemError:
-            # fallback to frequently saved syndicated for syndicated "More Stories from Pocket"
-            recs = await self.item_recommender.frequently_saved_syndicated(count=100)
+        # request more to apply domain diversification
+        # fallback to frequently saved syndicated for syndicated "More Stories from Pocket"
+        recs, used_fallback = await self._fetch_with_hedged_fallback(
+            self.item_recommender.syndicated(resolved_id, 20),
+            lambda: self.item_recommender.frequently_saved_syndicated(count=100))
+        if used_fallback:
             random.shuffle(recs)
         recs = unique_domains_first(recs)
         return self._to_corpus_items(recs, count)
 
-    @_empty_on_error
     async def by_publisher(self,
                            resolved_id: int,
                            original_id: int,
                            domain: str,
                            count: int) -> List[CorpusRecommendationModel]:
-        try:
-            recs = await self.item_recommender.by_publisher(resolved_id, domain, original_id, count)
-        except Item2ItemError:
-            # fallback to random by the same publisher for syndicated right rail
-            recs = await self.item_recommender.random_by_publisher(domain, count=100)
-            random.shuffle(recs)
+        # fallback to random by the same publisher for syndicated right rail
+        recs, used_fallback = await self._fetch_with_hedged_fallback(
+            self.item_recommender.by_publisher(resolved_id, domain, original_id, count),
+            lambda: self.item_recommender.random_by_publisher(domain, count=100))
+        if used_fallback:
+            if len(recs) > count:
+                # only count recs are kept, so sampling them is cheaper than shuffling the full fallback list
+                recs = random.sample(recs, count)
+            else:
+                random.shuffle(recs)
         return self._to_corpus_items(recs, count)
 
     @staticmethod
     def _to_corpus_items(recs, count):
-        return [CorpusRecommendationModel(corpus_item=CorpusItemModel(id=r.corpus_item_id, topic=None))
+        # construct() skips pydantic validation; ids come straight from the recommender and need no coercion.
+        return [CorpusRecommendationModel.construct(corpus_item=CorpusItemModel.construct(id=r.corpus_item_id,
+                                                                                          topic=None))
                 for r in recs[:count]]
 
 
@@ -147,6 +207,13 @@ class HomeDispatch:
         self.life_hacks_slate_provider = life_hacks_slate_provider
         self.unleash_provider = unleash_provider
 
+        # Bound get_slate references for providers that are called on every request, resolved once here instead of
+        # doing the attribute lookup and bound-method allocation on the hot path.
+        self._get_pocket_hits_slate = pocket_hits_slate_provider.get_slate
+        self._get_collection_slate = collection_slate_provider.get_slate
+        self._get_life_hacks_slate = life_hacks_slate_provider.get_slate
+        self._get_recommended_reads_slate = recommended_reads_slate_provider.get_slate
+
     async def get_slate_lineup(
             self, user: RequestUser, locale: LocaleModel, recommendation_count: int,
             api_client: ApiClient
@@ -190,43 +257,58 @@ class HomeDispatch:
         if self.hybrid_cf_slate_provider.can_recommend(user):
             user.user_models.append('hybrid_cf')
 
-        user_impression_capped_list, \
-        preferred_topics, \
-        unleash_asn = await gather(
-            self.user_impression_cap_provider.get(user),
-            self._get_preferred_topics(user),
+        # Pre-create tasks such that all fetches are scheduled immediately, and await them one-by-one via _await_all,
+        # which avoids the per-child future and callback machinery that asyncio.gather sets up for its result list.
+        # Slates that don't depend on user preferences are started right away, such that they don't have to wait
+        # behind the user/preferences/unleash lookups below.
+        pocket_hits_task = asyncio.ensure_future(self._get_pocket_hits_slate())
+        collection_task = asyncio.ensure_future(self._get_collection_slate())
+        life_hacks_task = asyncio.ensure_future(self._get_life_hacks_slate())
+
+        user_impression_capped_task = asyncio.ensure_future(self.user_impression_cap_provider.get(user))
+        preferred_topics_task = asyncio.ensure_future(self._get_preferred_topics(user))
+        # Speculatively fetch the default topics concurrently with the preferences lookup. Most users have no
+        # preferred topics, and for them this takes the topic lookup off the critical path of the topic slates.
+        default_topics_task = asyncio.ensure_future(self.topic_provider.get_topics(DEFAULT_TOPICS))
+        unleash_task = asyncio.ensure_future(
             self.unleash_provider.get_assignments(['temp.web.recommendation-api.home.hybrid_cf_test'], user=user))
 
+        user_impression_capped_list = await user_impression_capped_task
+        preferred_topics = await preferred_topics_task
+        unleash_asn = await unleash_task
+
         cf_asn = unleash_asn[0]
         enable_hybrid_cf = cf_asn is not None and cf_asn.variant == 'treatment'
 
         if not enable_hybrid_cf and self.hybrid_cf_slate_provider.can_recommend(user):
             logging.error('The CF experiment should enroll 100% of eligible users.')
 
-        slates = []
         if enable_hybrid_cf and self.hybrid_cf_slate_provider.can_recommend(user):
-            slates += [self.hybrid_cf_slate_provider.get_slate(user=user,
-                                                               user_impression_capped_list=user_impression_capped_list)]
+            first_slate = self.hybrid_cf_slate_provider.get_slate(
+                user=user, user_impression_capped_list=user_impression_capped_list)
+        elif preferred_topics:
+            first_slate = self.for_you_slate_provider.get_slate(
+                preferred_topics=preferred_topics,
+                user_impression_capped_list=user_impression_capped_list
+            )
         else:
-            if preferred_topics:
-                slates += [self.for_you_slate_provider.get_slate(
-                    preferred_topics=preferred_topics,
-                    user_impression_capped_list=user_impression_capped_list
-                )]
-            else:
-                slates += [self.recommended_reads_slate_provider.get_slate()]
+            first_slate = self._get_recommended_reads_slate()
 
-        slates += [
-            self.pocket_hits_slate_provider.get_slate(),
-            self.collection_slate_provider.get_slate(),
-            self.life_hacks_slate_provider.get_slate(),
+        slate_tasks = [
+            asyncio.ensure_future(first_slate),
+            pocket_hits_task,
+            collection_task,
+            life_hacks_task,
         ]
 
-        slates += await self._get_topic_slate_promises(preferred_topics=preferred_topics, default=DEFAULT_TOPICS)
+        topic_slates = await self._get_topic_slate_promises(
+            preferred_topics=preferred_topics, default=DEFAULT_TOPICS, default_topics_task=default_topics_task)
+        # extend with a generator appends in-place, without building an intermediate list to concatenate
+        slate_tasks.extend(asyncio.ensure_future(slate) for slate in topic_slates)
 
         return CorpusSlateLineupModel(
             slates=self._dedupe_and_limit(
-                slates=list(await gather(*slates)),
+                slates=await _await_all(slate_tasks),
                 recommendation_count=recommendation_count,
             ),
         ), cf_asn
@@ -241,16 +323,17 @@ class HomeDispatch:
             2. Collection slate
             3. Topic slates according to defaults
         """
-        slates = [
-            self.recommended_reads_slate_provider.get_slate(),
-            self.collection_slate_provider.get_slate(),
+        slate_tasks = [
+            asyncio.ensure_future(self._get_recommended_reads_slate()),
+            asyncio.ensure_future(self._get_collection_slate()),
         ]
 
-        slates += await self._get_topic_slate_promises(preferred_topics=[], default=GERMAN_HOME_TOPICS)
+        topic_slates = await self._get_topic_slate_promises(preferred_topics=[], default=GERMAN_HOME_TOPICS)
+        slate_tasks.extend(asyncio.ensure_future(slate) for slate in topic_slates)
 
         return CorpusSlateLineupModel(
             slates=self._dedupe_and_limit(
-                slates=list(await gather(*slates)),
+                slates=await _await_all(slate_tasks),
                 recommendation_count=recommendation_count,
             ),
         ), None
@@ -268,14 +351,23 @@ class HomeDispatch:
         seen_corpus_ids = set()
 
         for slate in slates:
-            slate.remove_corpus_items(seen_corpus_ids).limit(recommendation_count)
-            # Add all CorpusItem ids from slate to seen_item_ids
-            seen_corpus_ids |= set(slate.corpus_item_ids())
+            # Filter, limit, and track seen CorpusItem ids in a single pass over the recommendations, stopping as
+            # soon as the slate is filled up to recommendation_count.
+            kept_recommendations = []
+            for recommendation in slate.recommendations:
+                corpus_item_id = recommendation.corpus_item.id
+                if corpus_item_id not in seen_corpus_ids:
+                    seen_corpus_ids.add(corpus_item_id)
+                    kept_recommendations.append(recommendation)
+                    if len(kept_recommendations) == recommendation_count:
+                        break
+            slate.recommendations = kept_recommendations
 
         return slates
 
     async def _get_preferred_topics(self, user: RequestUser) -> List[TopicModel]:
-        preferences = await self.preferences_provider.fetch(str(user.hashed_user_id))
+        # hashed_user_id is already a str on RequestUser, so no stringification is needed here.
+        preferences = await self.preferences_provider.fetch(user.hashed_user_id)
         if preferences and preferences.preferred_topics:
             return preferences.preferred_topics
         else:
@@ -284,15 +376,25 @@ class HomeDispatch:
     async def _get_topic_slate_promises(
             self,
             preferred_topics: List[TopicModel],
-            default: List[str],
+            default: Sequence[str],
+            default_topics_task: Optional['asyncio.Task'] = None,
     ) -> List[Coroutine[Any, Any, CorpusSlateModel]]:
         """
         :param preferred_topics: List topics that the user prefers.
-        :param default: List of default topic ids to fall back to, if the user has no preferred topics.
+        :param default: Default topic ids to fall back to, if the user has no preferred topics.
+        :param default_topics_task: (optional) A speculatively started get_topics(default) task, which is used instead
+                                    of fetching the default topics here, or discarded if the user has preferred topics.
         :return: List of callables/promises that return topic slates when awaited.
         """
         preferred_topic_ids = [t.id for t in preferred_topics]
-        topics = await self.topic_provider.get_topics(preferred_topic_ids or default)
+        if preferred_topic_ids:
+            if default_topics_task is not None:
+                _discard_task(default_topics_task)
+            topics = await self.topic_provider.get_topics(preferred_topic_ids)
+        elif default_topics_task is not None:
+            topics = await default_topics_task
+        else:
+            topics = await self.topic_provider.get_topics(default)
         return [self.topic_slate_providers[topic].get_slate() for topic in topics]
 
 
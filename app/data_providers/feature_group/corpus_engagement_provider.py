@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import botocore.exceptions
 from aiocache import multi_cached
@@ -18,6 +19,9 @@ class CorpusEngagementProvider:
 
     def __init__(self, feature_group_client: FeatureGroupClient):
         self.feature_group_client = feature_group_client
+        # Dataloader-style state: keys from concurrent callers are collected here and fetched in a single batch.
+        self._pending_keys: List[str] = []
+        self._batch_future: Optional[asyncio.Future] = None
 
     async def get(
             self,
@@ -45,11 +49,7 @@ class CorpusEngagementProvider:
                  Returns MissingRecord if key is not found.
         """
         try:
-            records = await self.feature_group_client.batch_get_records(
-                feature_group_name=self.feature_group_name,
-                feature_names=self.feature_names,
-                ids=keys
-            )
+            records = await self._load_records(keys)
 
             engagement_models = [self.parse_record(r) for r in records]
             models_by_key = {m.key: m for m in engagement_models}
@@ -65,6 +65,41 @@ class CorpusEngagementProvider:
         # Missing records are cached to prevent a request going to the feature group on every function call.
         return {key: models_by_key.get(key, self.MissingRecord) for key in keys}
 
+    async def _load_records(self, keys: List[str]) -> List[Dict[str, str]]:
+        """
+        Dataloader-style batching: keys from callers in the same event-loop iteration - for example the slate
+        providers that rank one Home lineup concurrently - are combined into a single Feature Store request,
+        instead of one BatchGetRecord round-trip per slate.
+
+        :param keys: Engagement keys to fetch.
+        :return: Records for the given keys, in no particular order. Missing keys yield no record.
+        """
+        self._pending_keys.extend(keys)
+        if self._batch_future is None:
+            self._batch_future = asyncio.get_event_loop().create_future()
+            asyncio.get_event_loop().call_soon(self._start_batch)
+
+        records_by_key = await self._batch_future
+
+        return [records_by_key[key] for key in keys if key in records_by_key]
+
+    def _start_batch(self):
+        keys, self._pending_keys = self._pending_keys, []
+        future, self._batch_future = self._batch_future, None
+        asyncio.ensure_future(self._fetch_batch(keys, future))
+
+    async def _fetch_batch(self, keys: List[str], future: asyncio.Future):
+        try:
+            records = await self.feature_group_client.batch_get_records(
+                feature_group_name=self.feature_group_name,
+                feature_names=self.feature_names,
+                ids=keys,
+            )
+            future.set_result({record['KEY']: record for record in records})
+        except Exception as e:
+            # Propagate to all awaiting callers; _get_engagement_by_keys handles the error per caller.
+            future.set_exception(e)
+
     @property
     def feature_group_name(self):
         return f'{config.ENV}-corpus-engagement-v1'
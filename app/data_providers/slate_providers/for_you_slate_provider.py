@@ -68,8 +68,9 @@ class ForYouSlateProvider(HomeSlateProvider):
         """
         preferred_topic_by_id: Dict[str, TopicModel] = {t.corpus_topic_id: t for t in preferred_topics}
 
+        # construct() skips pydantic validation, which is redundant here because the items are validated models.
         return [
-            CorpusRecommendationModel(
+            CorpusRecommendationModel.construct(
                 corpus_item=item,
                 reason=RecommendationReasonModel(
                     name=preferred_topic_by_id[item.topic].name,
@@ -67,8 +67,9 @@ class NewTabSlateProvider(SlateProvider):
         :return: CorpusRecommendationModel with a tileId that's used in Firefox telemetry to identify items. tileId
                  uniquely identifies the scheduled surface, scheduled time, and CorpusItem.id of a recommendation.
         """
+        # construct() skips pydantic validation, which is redundant here because the items are validated models.
         return [
-            CorpusRecommendationModel(
+            CorpusRecommendationModel.construct(
                 corpus_item=item,
                 tile_id=integer_hash(self._get_tile_id_key(item), start=MIN_TILE_ID, stop=MAX_TILE_ID + 1)
             ) for item in ranked_items
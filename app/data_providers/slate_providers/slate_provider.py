@@ -15,6 +15,10 @@ from app.models.corpus_slate_model import CorpusSlateModel
 from app.models.link import LinkModel
 from app.models.localemodel import LocaleModel
 
+# The tracer is created once on import; get_tracer goes through the global tracer provider on every call, which is
+# unnecessary overhead on the per-slate hot path.
+tracer = trace.get_tracer(__name__)
+
 
 class SlateProvider(ABC):
 
@@ -117,7 +121,8 @@ class SlateProvider(ABC):
         :param ranked_items: The ranked Corpus items to be recommended.
         :return: a CorpusRecommendationModel for each given CorpusItemModel.
         """
-        return [CorpusRecommendationModel(corpus_item=item) for item in ranked_items]
+        # construct() skips pydantic validation, which is redundant here because the items are validated models.
+        return [CorpusRecommendationModel.construct(corpus_item=item) for item in ranked_items]
 
     async def get_slate(self, *args, **kwargs) -> CorpusSlateModel:
         """
@@ -126,7 +131,7 @@ class SlateProvider(ABC):
         Fewer may be returned if insufficient content is available.
         :return: A Corpus Slate that can be recommended
         """
-        with trace.get_tracer(__name__).start_as_current_span(f'{str(self)}.get_slate'):
+        with tracer.start_as_current_span(f'{str(self)}.get_slate'):
             candidate_items = await self.get_candidate_corpus_items(*args, **kwargs)
             ranked_items = await self.rank_corpus_items(candidate_items, *args, **kwargs)
             recommendations = await self.get_recommendations(ranked_items, *args, **kwargs)
@@ -1,3 +1,5 @@
+from typing import Dict
+
 from app.data_providers.slate_providers.topic_slate_provider import TopicSlateProvider
 from app.models.topic import TopicModel
 
@@ -7,10 +9,18 @@ class TopicSlateProviderFactory:
     def __init__(self, *args, **kwargs):
         self.slate_provider_args = args
         self.slate_provider_kwargs = kwargs
+        self._providers_by_topic_id: Dict[str, TopicSlateProvider] = {}
 
     def __getitem__(self, topic: TopicModel) -> TopicSlateProvider:
         """
+        Providers are memoized by topic id, such that repeated lookups for the same topic reuse the same instance
+        instead of constructing a new provider on every request.
+
         :param topic:
         :return: A TopicSlateProvider for the given topic
         """
-        return TopicSlateProvider(topic=topic, *self.slate_provider_args, **self.slate_provider_kwargs)
+        provider = self._providers_by_topic_id.get(topic.id)
+        if provider is None:
+            provider = TopicSlateProvider(topic=topic, *self.slate_provider_args, **self.slate_provider_kwargs)
+            self._providers_by_topic_id[topic.id] = provider
+        return provider
@@ -15,6 +15,8 @@ from app.models.corpus_recommendations_send_event import CorpusRecommendationsSe
 from app.models.unleash_assignment import UnleashAssignmentModel
 from app.models.request_user import RequestUser
 
+tracer = trace.get_tracer(__name__)
+
 
 class SnowplowCorpusRecommendationsTracker:
     """
@@ -32,7 +34,7 @@ class SnowplowCorpusRecommendationsTracker:
         Track the recommendation of a CorpusSlate or CorpusSlateLineup in Snowplow.
         :param event: Context for the slate or slate lineup being recommended to the client.
         """
-        with trace.get_tracer(__name__).start_as_current_span('SnowplowCorpusRecommendationsTracker.track'):
+        with tracer.start_as_current_span('SnowplowCorpusRecommendationsTracker.track'):
             track_calls = [self.track_corpus_recommendations_event_send(event)]
             if event.experiment:
                 track_calls.append(
@@ -8,4 +8,4 @@ def get_subject(user: RequestUser) -> Subject:
     :param user:
     :return: Snowplow Subject
     """
-    return Subject().set_user_id(str(user.user_id))
+    return Subject().set_user_id(user.str_user_id)
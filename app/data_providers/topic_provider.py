@@ -42,8 +42,13 @@ class TopicProvider:
             response = await table.scan()
             return response['Items']
 
+    @cached(ttl=600, key_builder=lambda f, self, topics_ids:
+            f'TopicProvider.get_topics/{self.locale.value}/{",".join(topics_ids)}')
     async def get_topics(self, topics_ids: Sequence[str]) -> List[TopicModel]:
         """
+        The result is cached per locale and topic id list, because the same id lists (e.g. DEFAULT_TOPICS) resolve to
+        the same TopicModels on almost every request.
+
         :param topics_ids: List or tuple of topic ids. Invalid ids are ignored.
         :return: A list of TopicModel objects for the given topic_ids.
         """
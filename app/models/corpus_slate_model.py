@@ -1,4 +1,4 @@
-from typing import List, Optional, Set, Generator
+from typing import List, Optional
 from uuid import uuid4
 
 from pydantic import BaseModel, Field
@@ -36,27 +36,3 @@ class CorpusSlateModel(BaseModel):
     utm_source: Optional[str] = Field(
         default=None,
         description='utm_source value that can be set on the url by the caller to attribute the recommendations.')
-
-    def remove_corpus_items(self, corpus_item_ids: Set[str]) -> 'CorpusSlateModel':
-        """
-        Remove recommendations from this slate which match the given corpus item ids.
-        :param corpus_item_ids: CorpusItem ids to be removed from this slate.
-        :return: self
-        """
-        self.recommendations = [r for r in self.recommendations if r.corpus_item.id not in corpus_item_ids]
-        return self
-
-    def limit(self, count: int) -> 'CorpusSlateModel':
-        """
-        Keep the first _count_ recommendations in this slate.
-        :param count: Maximum number of recommendations to keep.
-        :return: self
-        """
-        self.recommendations = self.recommendations[:count]
-        return self
-
-    def corpus_item_ids(self) -> Generator[str, None, None]:
-        """
-        :return: This slate's CorpusItem ids in-order of recommendation
-        """
-        return (r.corpus_item.id for r in self.recommendations)
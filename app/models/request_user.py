@@ -19,3 +19,10 @@ class RequestUser(BaseModel):
     hashed_guid: str = None
     locale: str = None  # e.g. en-US
     user_models: List[str] = []
+
+    @property
+    def str_user_id(self) -> str:
+        """
+        :return: user_id in the string form expected by headers and Snowplow.
+        """
+        return str(self.user_id)
@@ -9,8 +9,7 @@ from app.models.metrics.metrics_model import MetricsModel
 
 from app.config import ROOT_DIR
 from typing import List, Dict, Optional, Union
-from operator import itemgetter
-from scipy.stats import beta
+import numpy as np
 
 from app.models.slate_config import SlateConfigModel
 from app.models.topic import TopicModel
@@ -23,6 +22,9 @@ DEFAULT_BETA_PRIOR = 1.0
 DEFAULT_FIREFOX_BETA_PRIOR = 15600
 DEFAULT_FIREFOX_ALPHA_PRIOR = int(0.0085 * DEFAULT_FIREFOX_BETA_PRIOR)
 
+# Module-level generator for Thompson sampling, so each call doesn't pay to construct (and re-seed) a new one.
+_rng = np.random.default_rng()
+
 RankableListType = Union[List['SlateConfigModel'], List['RecommendationModel'], List['CorpusItem']]
 RecommendationListType = List['RecommendationModel']
 CorpusItemListType = List[CorpusItemModel]
@@ -59,9 +61,12 @@ def blocklist(recs: RecommendationListType, blocklist: Optional[List[str]] = Non
     if not blocklist:
         with open(ROOT_DIR + "/app/resources/blocklists.json", "r") as fp:
             blocklists = json.load(fp)
-        return [rec for rec in recs if str(rec.item.item_id) not in blocklists["items"]]
+        # frozenset membership is O(1) per rec, instead of scanning the blocklist for every rec.
+        blocked_item_ids = frozenset(blocklists["items"])
+        return [rec for rec in recs if str(rec.item.item_id) not in blocked_item_ids]
     else:
-        return [rec for rec in recs if rec.item.item_id not in blocklist]
+        blocked_item_ids = frozenset(blocklist)
+        return [rec for rec in recs if rec.item.item_id not in blocked_item_ids]
 
 
 def thompson_sampling(
@@ -100,39 +105,45 @@ def thompson_sampling(
     #  'default' key that aggregates engagement data in the same table, such that no additional lookups are required.
     alpha_prior, beta_prior = default_alpha_prior, default_beta_prior
 
-    scores = []
-    # create prior distribution for CTR from parameters in click data table
-    prior = beta(alpha_prior, beta_prior)
+    # Pre-extract each rec's metrics model in one pass. `metrics.get` does a single dict lookup per rec, instead of
+    # a membership check followed by a subscript.
+    metrics_models = []
     for rec in recs:
         # When metrics data no longer keyed on item_id, we can simple do `metrics_model = metrics.get(rec.id)`.
-        if rec.id in metrics:
-            metrics_model = metrics[rec.id]
-        else:
+        metrics_model = metrics.get(rec.id)
+        if metrics_model is None:
             try:
                 # Legacy recommendations are keyed on item_id.  Note that the metrics model grabs the item_id
                 # when it parses the clickdata by splitting the primary key in dynamo.
                 metrics_model = metrics.get(rec.item.item_id, None)
             except AttributeError:
                 metrics_model = None
+        metrics_models.append(metrics_model)
 
+    opens = []
+    no_opens = []
+    for rec, metrics_model in zip(recs, metrics_models):
         if metrics_model:
             open_metric = getattr(metrics_model, opens_column)
             imprs_metric = getattr(metrics_model, imprs_column)
 
-            opens = max(open_metric + alpha_prior, 1e-18)
+            opens.append(max(open_metric + alpha_prior, 1e-18))
             # posterior combines click data with prior (also a beta distribution)
-            no_opens = max(imprs_metric - open_metric + beta_prior, 1e-18)
-            # sample from posterior for CTR given click data
-            score = beta.rvs(opens, no_opens)
-            scores.append((rec, score))
+            no_opens.append(max(imprs_metric - open_metric + beta_prior, 1e-18))
 
             if hasattr(rec, 'ranked_with_engagement_updated_at') and hasattr(metrics_model, 'updated_at'):
                 rec.ranked_with_engagement_updated_at = metrics_model.updated_at
-        else:  # no click data, sample from module prior
-            scores.append((rec, prior.rvs()))
+        else:  # no click data, sample from the prior parameters
+            opens.append(alpha_prior)
+            no_opens.append(beta_prior)
 
-    scores.sort(key=itemgetter(1), reverse=True)
-    return [x[0] for x in scores]
+    # sample CTR for every rec from its posterior (or the prior, when click data is missing) in a single batched
+    # numpy call, which skips scipy's frozen-distribution wrapper and its per-call argument validation
+    scores = _rng.beta(np.asarray(opens), np.asarray(no_opens))
+
+    # argsort the negated scores to rank descending; a stable sort keeps the input order for equal scores, matching
+    # the list.sort behavior this replaces
+    return [recs[i] for i in np.argsort(-scores, kind='stable')]
 
 
 thompson_sampling_1day = partial(thompson_sampling, trailing_period=1)
@@ -152,9 +163,13 @@ def rank_by_impression_caps(
     :param user_impression_capped_list a list of CorpusItem ids loaded from the feature store per user
     :return: ranked list of recs for the user
     """
-    capped_corpus_item_ids = {c.id for c in user_impression_capped_list}
-    return [r for r in recs if r.id not in capped_corpus_item_ids] + \
-           [r for r in recs if r.id in capped_corpus_item_ids]
+    capped_corpus_item_ids = frozenset(c.id for c in user_impression_capped_list)
+    # Partition in a single pass so each rec pays one membership lookup, instead of two comprehensions that each
+    # walk the full list.
+    uncapped, capped = [], []
+    for rec in recs:
+        (capped if rec.id in capped_corpus_item_ids else uncapped).append(rec)
+    return uncapped + capped
 
 
 def rank_by_preferred_topics(
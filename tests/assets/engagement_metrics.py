@@ -1,5 +1,7 @@
 import datetime
-from typing import Dict, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping
 
 from app.models.corpus_item_model import CorpusItemModel
 from app.models.metrics.corpus_item_engagement_model import CorpusItemEngagementModel
@@ -37,11 +39,15 @@ def generate_metrics_model_dict(**kwargs) -> Dict[str, 'MetricsModel']:
     return {model.id.split('/')[1]: model}
 
 
-def generate_metrics(period) -> Dict[str, 'MetricsModel']:
+@lru_cache(maxsize=None)
+def generate_metrics(period) -> Mapping[str, 'MetricsModel']:
     """
     Generates a dictionary of MetricsModel, mirroring AbstractMetricsFactory.get()
+
+    The result is memoized and returned as a read-only mapping, so repeated calls for the same period share one set
+    of models instead of rebuilding them.
     :param period: Trailing day number to set metrics for: 1, 7, 14, or 28
-    :return: Dictionary where values are FirefoxNewTabMetricsModel, with
+    :return: Read-only mapping where values are FirefoxNewTabMetricsModel, with
              - item_id being "999999", "666666", "333333"
              - opens equal to the last two digits of the item id for the given period
              - impressions being equal to 999 for the given period
@@ -59,7 +65,7 @@ def generate_metrics(period) -> Dict[str, 'MetricsModel']:
     for kwargs in kwargs_list:
         metrics.update(generate_metrics_model_dict(**kwargs))
 
-    return metrics
+    return MappingProxyType(metrics)
 
 
 def generate_corpus_engagement(recommendations: List[CorpusItemModel]) -> Dict[str, 'CorpusItemEngagementModel']:
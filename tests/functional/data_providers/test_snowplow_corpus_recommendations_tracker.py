@@ -10,7 +10,7 @@ from app.models.corpus_recommendations_send_event import CorpusRecommendationsSe
 from app.models.corpus_slate_lineup_model import RecommendationSurfaceId
 from app.models.localemodel import LocaleModel
 from app.models.unleash_assignment import UnleashAssignmentModel
-from tests.functional.test_util.snowplow import wait_for_snowplow_events
+from tests.functional.test_util.snowplow import assert_event_counts, wait_for_snowplow_events
 
 
 @pytest.fixture
@@ -47,8 +47,7 @@ async def test_track_slate_lineup(snowplow_micro, snowplow_recs_tracker, slate_l
     assert not any(r for r in caplog.records if r.levelname in ('WARNING', 'ERROR', 'CRITICAL'))
 
     await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-    all_snowplow_events = snowplow_micro.get_event_counts()
-    assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+    assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
 
 
 @pytest.mark.asyncio
@@ -59,8 +58,7 @@ async def test_track_slate(snowplow_micro, snowplow_recs_tracker, slate_send_eve
     assert not any(r for r in caplog.records if r.levelname in ('WARNING', 'ERROR', 'CRITICAL'))
 
     await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-    all_snowplow_events = snowplow_micro.get_event_counts()
-    assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+    assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
 
 
 @pytest.mark.asyncio
@@ -73,8 +71,7 @@ async def test_track_engagement_updated_at(snowplow_micro, snowplow_recs_tracker
     await snowplow_recs_tracker.track(slate_send_event)
 
     await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-    all_snowplow_events = snowplow_micro.get_event_counts()
-    assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+    assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
 
     # Check that the optional attribute was sent to Snowplow. The assertion above confirms the event schema is valid.
     good_event = json.dumps(snowplow_micro.get_good_events()[0]['event'])
@@ -91,8 +88,7 @@ async def test_track_tile_id(snowplow_micro, snowplow_recs_tracker, slate_send_e
     await snowplow_recs_tracker.track(slate_send_event)
 
     await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-    all_snowplow_events = snowplow_micro.get_event_counts()
-    assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+    assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
 
     # Check that the optional tile id was sent to Snowplow. The assertion above confirms the event schema is valid.
     good_event = json.dumps(snowplow_micro.get_good_events()[0]['event'])
@@ -107,8 +103,7 @@ async def test_track_experiment(snowplow_micro, snowplow_recs_tracker, slate_lin
 
     # Assert two events were sent to Snowplow: an event with recommendation metadata and a variant_enroll event.
     await wait_for_snowplow_events(snowplow_micro, n_expected_event=2)
-    all_snowplow_events = snowplow_micro.get_event_counts()
-    assert all_snowplow_events == {'total': 2, 'good': 2, 'bad': 0}
+    assert_event_counts(snowplow_micro, {'total': 2, 'good': 2, 'bad': 0})
 
 
 @pytest.mark.asyncio
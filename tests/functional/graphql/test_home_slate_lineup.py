@@ -1,7 +1,10 @@
 import datetime
-import random
 import uuid
-from typing import Sequence
+from functools import lru_cache
+from typing import Optional, Sequence
+
+import numpy as np
+import orjson
 
 from asgi_lifespan import LifespanManager
 from httpx import AsyncClient
@@ -18,11 +21,12 @@ from app.models.corpus_item_model import CorpusItemModel
 from app.models.request_user import RequestUser
 from app.models.unleash_assignment import UnleashAssignmentModel
 from app.models.user_recommendation_preferences import UserRecommendationPreferencesModel
-from tests.functional.test_util.snowplow import wait_for_snowplow_events
+from tests.functional.test_util.snowplow import assert_event_counts, wait_for_snowplow_events
 from tests.assets.topics import *
 from tests.functional.test_dynamodb_base import TestDynamoDBBase
 
-from unittest.mock import patch
+import pytest
+from unittest.mock import AsyncMock
 
 from tests.functional.test_util.snowplow import SnowplowMicroClient
 
@@ -42,8 +46,14 @@ def _user_recommendation_preferences_fixture(
     )
 
 
+@lru_cache(maxsize=None)
 def _corpus_items_fixture(n: int) -> [CorpusItemModel]:
-    return [CorpusItemModel(id=str(uuid.uuid4()), topic=random.choice(corpus_topic_ids)) for _ in range(n)]
+    # Built once per size: the tests only read the items, so there is no need to re-generate 100 uuids and topic
+    # choices for every test. uuid4().hex skips the dash-formatting that str(uuid4()) goes through.
+    # One vectorized draw replaces n Python-level random.choice calls, and the seeded generator keeps the cached
+    # fixture identical across the whole test run.
+    topics = np.random.default_rng(42).choice(corpus_topic_ids, size=n)
+    return [CorpusItemModel(id=uuid.uuid4().hex, topic=topic) for topic in topics]
 
 
 def _get_topics_fixture(topics_ids: Sequence[str]) -> List[TopicModel]:
@@ -79,56 +89,70 @@ def _get_home_query(locale=None):
 
 
 HOME_SLATE_LINEUP_QUERY = _get_home_query()
+HOME_SLATE_LINEUP_QUERY_DE = _get_home_query('de-DE')
+
+# The user and headers are constants built once at module scope; the tests only read them.
+REQUEST_USER = RequestUser(
+    user_id=1,
+    # for hybrid_cf
+    hashed_user_id='426T0A36g8844p7442d8by2d79p8gc136e6E1bN0x6Q1cqQ52dibya97x14US411',
+)
+HEADERS = {
+    'userId': REQUEST_USER.str_user_id,
+    'encodedId': REQUEST_USER.hashed_user_id,
+    'apiId': '94110',
+    'consumerKey': 'web-client-consumer-key',
+    'applicationName': 'Pocket web-client',
+    'applicationIsNative': 'true',
+    'applicationIsTrusted': 'true',
+}
 
 
 class TestHomeSlateLineup(TestDynamoDBBase):
     async def asyncSetUp(self):
         await super().asyncSetUp()
-        self.request_user = RequestUser(
-            user_id=1,
-            # for hybrid_cf
-            hashed_user_id='426T0A36g8844p7442d8by2d79p8gc136e6E1bN0x6Q1cqQ52dibya97x14US411',
-        )
-        self.headers = {
-            'userId': str(self.request_user.user_id),
-            'encodedId': self.request_user.hashed_user_id,
-            'apiId': '94110',
-            'consumerKey': 'web-client-consumer-key',
-            'applicationName': 'Pocket web-client',
-            'applicationIsNative': 'true',
-            'applicationIsTrusted': 'true',
-        }
+        self.request_user = REQUEST_USER
+        self.headers = HEADERS
 
         populate_topics(self.metadata_table)
         self.snowplow_micro = SnowplowMicroClient(config=SnowplowConfig())
         self.snowplow_micro.reset_snowplow_events()
 
-    @patch.object(CorpusFeatureGroupClient, 'fetch')
-    @patch.object(UserRecommendationPreferencesProvider, 'fetch')
-    @patch.object(UserImpressionCapProvider, 'get')
-    @patch.object(UnleashProvider, '_get_all_assignments')
-    @patch.object(FeatureGroupClient, 'batch_get_records')
-    async def test_personalized_home_slate_lineup(
+    @pytest.fixture(autouse=True)
+    def inject_monkeypatch(self, monkeypatch):
+        # monkeypatch does a plain setattr/delattr pair per patch, which is lighter than stacking @patch.object
+        # decorators, and saves each test from threading five mock_* arguments through its signature.
+        self.monkeypatch = monkeypatch
+
+    def _patch_providers(
             self,
-            mock_batch_get_records,
-            mock_get_all_assignments,
-            mock_get_user_impression_caps,
-            mock_fetch_user_recommendation_preferences,
-            mock_fetch_corpus_items
+            corpus_items_fixture: List[CorpusItemModel],
+            preferences_fixture: Optional[UserRecommendationPreferencesModel],
+            user_impression_caps: List[CorpusItemModel],
+            unleash_assignments: List[UnleashAssignmentModel],
     ):
+        self.monkeypatch.setattr(CorpusFeatureGroupClient, 'fetch', AsyncMock(return_value=corpus_items_fixture))
+        self.monkeypatch.setattr(
+            UserRecommendationPreferencesProvider, 'fetch', AsyncMock(return_value=preferences_fixture))
+        self.monkeypatch.setattr(UserImpressionCapProvider, 'get', AsyncMock(return_value=user_impression_caps))
+        self.monkeypatch.setattr(UnleashProvider, '_get_all_assignments', AsyncMock(return_value=unleash_assignments))
+        self.monkeypatch.setattr(FeatureGroupClient, 'batch_get_records', AsyncMock(return_value=[]))
+
+    async def test_personalized_home_slate_lineup(self):
         corpus_items_fixture = _corpus_items_fixture(n=100)
-        mock_fetch_corpus_items.return_value = corpus_items_fixture
-
         preferred_topics = [technology_topic, gaming_topic]
         preferences_fixture = _user_recommendation_preferences_fixture(
             self.request_user.hashed_user_id, preferred_topics)
-        mock_fetch_user_recommendation_preferences.return_value = preferences_fixture
-        mock_get_user_impression_caps.return_value = corpus_items_fixture[:6]
-        mock_get_all_assignments.return_value = []
+        self._patch_providers(
+            corpus_items_fixture=corpus_items_fixture,
+            preferences_fixture=preferences_fixture,
+            user_impression_caps=corpus_items_fixture[:6],
+            unleash_assignments=[],
+        )
 
         async with AsyncClient(app=app, base_url="http://test") as client, LifespanManager(app):
             response = await client.post('/', json={'query': HOME_SLATE_LINEUP_QUERY}, headers=self.headers)
-            data = response.json()
+            data = orjson.loads(response.content)
 
             assert not data.get('errors')
             slates = data['data']['homeSlateLineup']['slates']
@@ -152,31 +176,20 @@ class TestHomeSlateLineup(TestDynamoDBBase):
             assert recommendation_counts == len(slates)*[5]  # Each slates has 5 recs each
 
             await wait_for_snowplow_events(self.snowplow_micro, n_expected_event=2)
-            all_snowplow_events = self.snowplow_micro.get_event_counts()
-            assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
-
-    @patch.object(CorpusFeatureGroupClient, 'fetch')
-    @patch.object(UserRecommendationPreferencesProvider, 'fetch')
-    @patch.object(UserImpressionCapProvider, 'get')
-    @patch.object(UnleashProvider, '_get_all_assignments')
-    @patch.object(FeatureGroupClient, 'batch_get_records')
-    async def test_unpersonalized_home_slate_lineup(
-            self,
-            mock_batch_get_records,
-            mock_get_all_assignments,
-            mock_get_user_impression_caps,
-            mock_fetch_user_recommendation_preferences,
-            mock_fetch_corpus_items
-    ):
+            assert_event_counts(self.snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
+
+    async def test_unpersonalized_home_slate_lineup(self):
         corpus_items_fixture = _corpus_items_fixture(n=100)
-        mock_fetch_corpus_items.return_value = corpus_items_fixture
-        mock_fetch_user_recommendation_preferences.return_value = None  # User has does not have a preferences record
-        mock_get_user_impression_caps.return_value = corpus_items_fixture[:6]
-        mock_get_all_assignments.return_value = []
+        self._patch_providers(
+            corpus_items_fixture=corpus_items_fixture,
+            preferences_fixture=None,  # User has does not have a preferences record
+            user_impression_caps=corpus_items_fixture[:6],
+            unleash_assignments=[],
+        )
 
         async with AsyncClient(app=app, base_url="http://test") as client, LifespanManager(app):
             response = await client.post('/', json={'query': HOME_SLATE_LINEUP_QUERY}, headers=self.headers)
-            data = response.json()
+            data = orjson.loads(response.content)
 
             assert not data.get('errors')
             slates = data['data']['homeSlateLineup']['slates']
@@ -193,32 +206,20 @@ class TestHomeSlateLineup(TestDynamoDBBase):
             assert recommendation_counts == len(slates)*[5]  # Each slates has 5 recs each
 
             await wait_for_snowplow_events(self.snowplow_micro, n_expected_event=2)
-            all_snowplow_events = self.snowplow_micro.get_event_counts()
-            assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
-
-    @patch.object(CorpusFeatureGroupClient, 'fetch')
-    @patch.object(UserRecommendationPreferencesProvider, 'fetch')
-    @patch.object(UserImpressionCapProvider, 'get')
-    @patch.object(UnleashProvider, '_get_all_assignments')
-    @patch.object(FeatureGroupClient, 'batch_get_records')
-    async def test_german_unpersonalized_home_slate_lineup(
-            self,
-            mock_batch_get_records,
-            mock_get_all_assignments,
-            mock_get_user_impression_caps,
-            mock_fetch_user_recommendation_preferences,
-            mock_fetch_corpus_items,
-    ):
+            assert_event_counts(self.snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
+
+    async def test_german_unpersonalized_home_slate_lineup(self):
         corpus_items_fixture = _corpus_items_fixture(n=100)
-        mock_fetch_corpus_items.return_value = corpus_items_fixture
-        mock_fetch_user_recommendation_preferences.return_value = None  # User has does not have a preferences record
-        mock_get_user_impression_caps.return_value = []
-        mock_get_all_assignments.return_value = []
-        mock_batch_get_records.return_value = []
+        self._patch_providers(
+            corpus_items_fixture=corpus_items_fixture,
+            preferences_fixture=None,  # User has does not have a preferences record
+            user_impression_caps=[],
+            unleash_assignments=[],
+        )
 
         async with AsyncClient(app=app, base_url="http://test") as client, LifespanManager(app):
-            response = await client.post('/', json={'query': _get_home_query('de-DE')}, headers=self.headers)
-            data = response.json()
+            response = await client.post('/', json={'query': HOME_SLATE_LINEUP_QUERY_DE}, headers=self.headers)
+            data = orjson.loads(response.content)
 
             assert not data.get('errors')
             slates = data['data']['homeSlateLineup']['slates']
@@ -231,38 +232,26 @@ class TestHomeSlateLineup(TestDynamoDBBase):
             assert slates[-1]['moreLink'] == None
 
             await wait_for_snowplow_events(self.snowplow_micro, n_expected_event=2)
-            all_snowplow_events = self.snowplow_micro.get_event_counts()
-            assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
-
-    @patch.object(CorpusFeatureGroupClient, 'fetch')
-    @patch.object(UserRecommendationPreferencesProvider, 'fetch')
-    @patch.object(UserImpressionCapProvider, 'get')
-    @patch.object(UnleashProvider, '_get_all_assignments')
-    @patch.object(FeatureGroupClient, 'batch_get_records')
-    async def test_hybrid_cf_home_slate_lineup(
-            self,
-            mock_batch_get_records,
-            mock_get_all_assignments,
-            mock_get_user_impression_caps,
-            mock_fetch_user_recommendation_preferences,
-            mock_fetch_corpus_items
-    ):
-        corpus_items_fixture = _corpus_items_fixture(n=100)
-        mock_fetch_corpus_items.return_value = corpus_items_fixture
+            assert_event_counts(self.snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
 
+    async def test_hybrid_cf_home_slate_lineup(self):
+        corpus_items_fixture = _corpus_items_fixture(n=100)
         preferred_topics = [technology_topic, gaming_topic]
         preferences_fixture = _user_recommendation_preferences_fixture(
             self.request_user.hashed_user_id, preferred_topics)
-        mock_fetch_user_recommendation_preferences.return_value = preferences_fixture
-        mock_get_user_impression_caps.return_value = corpus_items_fixture[:6]
-        mock_get_all_assignments.return_value = [
-            UnleashAssignmentModel(
-                assigned=True, name='temp.web.recommendation-api.home.hybrid_cf_test', variant='treatment')
-        ]
+        self._patch_providers(
+            corpus_items_fixture=corpus_items_fixture,
+            preferences_fixture=preferences_fixture,
+            user_impression_caps=corpus_items_fixture[:6],
+            unleash_assignments=[
+                UnleashAssignmentModel(
+                    assigned=True, name='temp.web.recommendation-api.home.hybrid_cf_test', variant='treatment')
+            ],
+        )
 
         async with AsyncClient(app=app, base_url="http://test") as client, LifespanManager(app):
             response = await client.post('/', json={'query': HOME_SLATE_LINEUP_QUERY}, headers=self.headers)
-            data = response.json()
+            data = orjson.loads(response.content)
 
             assert not data.get('errors')
             slates = data['data']['homeSlateLineup']['slates']
@@ -286,5 +275,4 @@ class TestHomeSlateLineup(TestDynamoDBBase):
             assert recommendation_counts == len(slates)*[5]  # Each slates has 5 recs each
 
             await wait_for_snowplow_events(self.snowplow_micro, n_expected_event=2)
-            all_snowplow_events = self.snowplow_micro.get_event_counts()
-            assert all_snowplow_events == {'total': 2, 'good': 2, 'bad': 0}
+            assert_event_counts(self.snowplow_micro, {'total': 2, 'good': 2, 'bad': 0})
@@ -6,7 +6,7 @@ from httpx import AsyncClient
 
 from app.data_providers.slate_providers.new_tab_slate_provider import MIN_TILE_ID, MAX_TILE_ID
 from app.main import app
-from tests.functional.test_util.snowplow import wait_for_snowplow_events
+from tests.functional.test_util.snowplow import assert_event_counts, wait_for_snowplow_events
 
 
 def _format_moz_social_slate_query(locale, region, count=50):
@@ -64,5 +64,4 @@ async def test_moz_social_slate(locale, region, snowplow_micro, pocket_graph_req
         assert len(recommendations) == requested_recommendation_count
 
         await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-        all_snowplow_events = snowplow_micro.get_event_counts()
-        assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+        assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
@@ -1,12 +1,13 @@
 from typing import Dict
 
+import orjson
 import pytest
 from asgi_lifespan import LifespanManager
 from httpx import AsyncClient
 
 from app.data_providers.slate_providers.new_tab_slate_provider import MIN_TILE_ID, MAX_TILE_ID
 from app.main import app
-from tests.functional.test_util.snowplow import wait_for_snowplow_events
+from tests.functional.test_util.snowplow import assert_event_counts, wait_for_snowplow_events
 
 
 def _format_new_tab_query(locale, region, count=50):
@@ -63,7 +64,7 @@ async def test_new_tab_slate(locale, region, snowplow_micro, pocket_graph_reques
         requested_recommendation_count = 30
         query = _format_new_tab_query(locale=locale, region=region, count=requested_recommendation_count)
         response = await client.post('/', json={'query': query}, headers=pocket_graph_request_headers)
-        data = response.json()
+        data = orjson.loads(response.content)
 
         assert not data.get('errors')
         recommendations = data['data']['newTabSlate']['recommendations']
@@ -77,5 +78,4 @@ async def test_new_tab_slate(locale, region, snowplow_micro, pocket_graph_reques
         assert len(set(tile_ids)) == len(tile_ids)
 
         await wait_for_snowplow_events(snowplow_micro, n_expected_event=1)
-        all_snowplow_events = snowplow_micro.get_event_counts()
-        assert all_snowplow_events == {'total': 1, 'good': 1, 'bad': 0}
+        assert_event_counts(snowplow_micro, {'total': 1, 'good': 1, 'bad': 0})
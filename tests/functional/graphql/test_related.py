@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -16,6 +17,7 @@ from app import config
 from app.config import ROOT_DIR
 from app.recommenders.item2item import Item2ItemRecommender
 from app.main import app
+from tests.functional.test_util.caching import clear_item2item_caches
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import PointStruct, VectorParams, Distance
@@ -192,6 +194,8 @@ log_pattern = re.compile(
 
 
 class TestGraphQLRelated(TestCase):
+    client: TestClient
+
     @classmethod
     def setUpClass(cls):
         test_data = populate_qdrant()
@@ -200,6 +204,17 @@ class TestGraphQLRelated(TestCase):
             d['payload']['resolved_id'] = d['id']
             cls.art_by_corpus_id[d['payload']['corpus_item_id']] = d['payload']
 
+        # Enter the test client once for the whole class, such that application startup (router wiring, DI container
+        # init, cache setup) runs once instead of once per test.
+        cls.client = TestClient(app)
+        cls.client.__enter__()
+        cls.addClassCleanup(cls.client.__exit__, None, None, None)
+
+    def setUp(self):
+        super().setUp()
+        # The application no longer restarts between tests, so clear the recommender caches to keep tests independent.
+        asyncio.run(clear_item2item_caches())
+
     @pytest.fixture(autouse=True)
     def inject_fixtures(self, caplog):
         self.caplog = caplog
@@ -224,44 +239,42 @@ class TestGraphQLRelated(TestCase):
         """ recommend similar curated """
         item_id = '3727699409'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_save_json(item_id)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterCreate']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
-            assert all((datetime.now() - datetime.fromtimestamp
-                    (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
-                       for r in recs)
-            self.verify_logs(logging.INFO, item_id)
+        response = self.client.post("/", json=after_save_json(item_id)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterCreate']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
+        assert all((datetime.now() - datetime.fromtimestamp
+                (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
+                   for r in recs)
+        self.verify_logs(logging.INFO, item_id)
 
     def test_related_after_article(self):
         """ recommend similar curated """
         item_id = '3727699409'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_article_json(item_id)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterArticle']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
-            assert all((datetime.now() - datetime.fromtimestamp
-                    (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
-                       for r in recs)
-            assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
-            self.verify_logs(logging.INFO, item_id)
+        response = self.client.post("/", json=after_article_json(item_id)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterArticle']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
+        assert all((datetime.now() - datetime.fromtimestamp
+                (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
+                   for r in recs)
+        assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
+        self.verify_logs(logging.INFO, item_id)
 
     def test_related_end_of_syndicated_basic(self):
         """ recommend similar syndicated """
@@ -269,21 +282,20 @@ class TestGraphQLRelated(TestCase):
         pub_url = 'https://time.com/6223012/workplaces-of-the-future/'
         original_id = '2345678'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=syndicated_json(item_id, pub_url, original_id)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedEndOfArticle']
-            assert entity['itemId'] == item_id
-            assert entity['publisherUrl'] == pub_url
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
-            assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
-            self.verify_logs(logging.INFO, item_id)
+        response = self.client.post("/", json=syndicated_json(item_id, pub_url, original_id)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedEndOfArticle']
+        assert entity['itemId'] == item_id
+        assert entity['publisherUrl'] == pub_url
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
+        assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
+        self.verify_logs(logging.INFO, item_id)
 
     def test_related_right_rail_basic(self):
         """ recommend similar curated from the same publisher """
@@ -292,195 +304,184 @@ class TestGraphQLRelated(TestCase):
         pub_url = 'https://www.psyche.co/ideas/are-successful-authors-creative-geniuses-or-literary-labourers'
         original_id = '2345678'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url, original_id)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedRightRail']
-            assert entity['itemId'] == item_id
-            assert entity['publisherUrl'] == pub_url
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] == 'psyche.co' for r in recs)
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
-            assert all(not self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
-            # filter original article
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['resolved_id'] != 2345678 for r in recs)
-            self.verify_logs(logging.INFO, item_id)
+        response = self.client.post("/", json=publisher_json(item_id, pub_url, original_id)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedRightRail']
+        assert entity['itemId'] == item_id
+        assert entity['publisherUrl'] == pub_url
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] == 'psyche.co' for r in recs)
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
+        assert all(not self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
+        # filter original article
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['resolved_id'] != 2345678 for r in recs)
+        self.verify_logs(logging.INFO, item_id)
 
     def test_related_syndicated_article_doesnt_exist(self):
         """ fallback to random frequently saved syndicated """
         item_id = '11111'
         pub_url = 'xxxx'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=syndicated_json(item_id, pub_url)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedEndOfArticle']
-            assert entity['itemId'] == item_id
-            assert entity['publisherUrl'] == pub_url
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['save_count'] > Item2ItemRecommender.MIN_SAVE_COUNT
-                       for r in recs)
-            assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
-            self.verify_logs(logging.WARNING, item_id, msg='article not found')
-            self.verify_logs(logging.INFO, msg='scroll')
+        response = self.client.post("/", json=syndicated_json(item_id, pub_url)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedEndOfArticle']
+        assert entity['itemId'] == item_id
+        assert entity['publisherUrl'] == pub_url
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_syndicated'] for r in recs)
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['save_count'] > Item2ItemRecommender.MIN_SAVE_COUNT
+                   for r in recs)
+        assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
+        self.verify_logs(logging.WARNING, item_id, msg='article not found')
+        self.verify_logs(logging.INFO, msg='scroll')
 
     def test_related_right_rail_article_doesnt_exist(self):
         """ fallback to random from the same publisher """
         item_id = '11111'
         pub_url = 'https://psyche.co/ideas/are-successful-authors-creative-geniuses-or-literary-labourers'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedRightRail']
-            assert entity['itemId'] == item_id
-            assert entity['publisherUrl'] == pub_url
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] == 'psyche.co' for r in recs)
-            self.verify_logs(logging.WARNING, item_id, msg='article not found')
-            self.verify_logs(logging.INFO, msg='scroll')
+        response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedRightRail']
+        assert entity['itemId'] == item_id
+        assert entity['publisherUrl'] == pub_url
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] == 'psyche.co' for r in recs)
+        self.verify_logs(logging.WARNING, item_id, msg='article not found')
+        self.verify_logs(logging.INFO, msg='scroll')
 
     def test_related_right_rail_publisher_doesnt_exist(self):
         """ do not fallback, having the same publisher is a hard requirement """
         item_id = '3727501830'
         pub_url = 'https://xxx.co/ideas/'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedRightRail']
-            assert entity['itemId'] == item_id
-            assert entity['publisherUrl'] == pub_url
-            assert len(recs) == 0
-            self.verify_logs(logging.INFO, item_id)
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedRightRail']
+        assert entity['itemId'] == item_id
+        assert entity['publisherUrl'] == pub_url
+        assert len(recs) == 0
+        self.verify_logs(logging.INFO, item_id)
 
     def test_related_right_rail_article_and_publisher_dont_exist(self):
         """ do not fallback, having the same publisher is a hard requirement """
         item_id = '11111'
         pub_url = 'https://xxx.co/ideas/'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            recs = response['data']['_entities'][0]['relatedRightRail']
-            assert len(recs) == 0
-            self.verify_logs(logging.WARNING, item_id, msg='article not found')
-            self.verify_logs(logging.INFO, msg='scroll')
+        assert not response.get('errors')
+        recs = response['data']['_entities'][0]['relatedRightRail']
+        assert len(recs) == 0
+        self.verify_logs(logging.WARNING, item_id, msg='article not found')
+        self.verify_logs(logging.INFO, msg='scroll')
 
     def test_related_after_article_article_doesnt_exist(self):
         """ fallback to random frequently saved curated """
         item_id = '11111'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_article_json(item_id)).json()
-
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterArticle']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 3
-            assert 'id' in recs[0]
-            assert 'corpusItem' in recs[0]
-            assert 'id' in recs[0]['corpusItem']
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
-            assert all(self.art_by_corpus_id[r['corpusItem']['id']]['save_count'] > Item2ItemRecommender.MIN_SAVE_COUNT
-                       for r in recs)
-            assert all((datetime.now() - datetime.fromtimestamp
-                    (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
-                       for r in recs)
-            assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
-            self.verify_logs(logging.WARNING, item_id, msg='article not found')
-            self.verify_logs(logging.INFO, msg='scroll')
+        response = self.client.post("/", json=after_article_json(item_id)).json()
+
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterArticle']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 3
+        assert 'id' in recs[0]
+        assert 'corpusItem' in recs[0]
+        assert 'id' in recs[0]['corpusItem']
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['is_curated'] for r in recs)
+        assert all(self.art_by_corpus_id[r['corpusItem']['id']]['save_count'] > Item2ItemRecommender.MIN_SAVE_COUNT
+                   for r in recs)
+        assert all((datetime.now() - datetime.fromtimestamp
+                (self.art_by_corpus_id[r['corpusItem']['id']]['timestamp'])).days < Item2ItemRecommender.FRESHNESS
+                   for r in recs)
+        assert len(set(self.art_by_corpus_id[r['corpusItem']['id']]['domain'] for r in recs)) == 3
+        self.verify_logs(logging.WARNING, item_id, msg='article not found')
+        self.verify_logs(logging.INFO, msg='scroll')
 
     def test_related_after_save_article_doesnt_exist(self):
         """ do not fallback """
         item_id = '11111'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_save_json(item_id)).json()
+        response = self.client.post("/", json=after_save_json(item_id)).json()
 
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterCreate']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 0
-            self.verify_logs(logging.WARNING, item_id, msg='article not found')
-            self.verify_logs(logging.INFO, item_id, msg='recommend')
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterCreate']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 0
+        self.verify_logs(logging.WARNING, item_id, msg='article not found')
+        self.verify_logs(logging.INFO, item_id, msg='recommend')
 
     def test_related_after_save_lang_not_supported(self):
         """ do not fallback """
         item_id = '11111'
         lang = 'de'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_save_json(item_id, lang=lang)).json()
+        response = self.client.post("/", json=after_save_json(item_id, lang=lang)).json()
 
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterCreate']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 0
-            self.verify_logs(logging.WARNING, item_id, lang=lang, msg='unsupported language')
-            self.verify_logs(logging.INFO, item_id, lang=lang, msg='recommend')
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterCreate']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 0
+        self.verify_logs(logging.WARNING, item_id, lang=lang, msg='unsupported language')
+        self.verify_logs(logging.INFO, item_id, lang=lang, msg='recommend')
 
     def test_related_after_article_lang_not_supported(self):
         """ do not fallback """
         item_id = '11111'
         lang = 'de'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_article_json(item_id, lang=lang)).json()
+        response = self.client.post("/", json=after_article_json(item_id, lang=lang)).json()
 
-            assert not response.get('errors')
-            entity = response['data']['_entities'][0]
-            recs = entity['relatedAfterArticle']
-            assert entity['itemId'] == item_id
-            assert len(recs) == 0
-            self.verify_logs(logging.WARNING, item_id, lang=lang, msg='unsupported language')
-            self.verify_logs(logging.INFO, item_id, lang=lang, msg='recommend')
+        assert not response.get('errors')
+        entity = response['data']['_entities'][0]
+        recs = entity['relatedAfterArticle']
+        assert entity['itemId'] == item_id
+        assert len(recs) == 0
+        self.verify_logs(logging.WARNING, item_id, lang=lang, msg='unsupported language')
+        self.verify_logs(logging.INFO, item_id, lang=lang, msg='recommend')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     @patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock)
     def test_related_after_save_qdrant_outage(self):
         item_id = '3727501830'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_save_json(item_id)).json()
+        response = self.client.post("/", json=after_save_json(item_id)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedAfterCreate']) == 0
-            self.verify_logs(logging.ERROR, msg='unexpected response')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedAfterCreate']) == 0
+        self.verify_logs(logging.ERROR, msg='unexpected response')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_unexpected_error_mock)
     @patch.object(AsyncPointsApi, 'scroll_points', qdrant_unexpected_error_mock)
     def test_related_after_article_qdrant_outage(self):
         item_id = '3727699409'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_article_json(item_id)).json()
+        response = self.client.post("/", json=after_article_json(item_id)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 0
-            self.verify_logs(logging.ERROR, msg='Qdrant error')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 0
+        self.verify_logs(logging.ERROR, msg='Qdrant error')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     @patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock)
@@ -488,12 +489,11 @@ class TestGraphQLRelated(TestCase):
         item_id = '3727511744'
         pub_url = 'https://time.com/6223012/workplaces-of-the-future/'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=syndicated_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=syndicated_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 0
-            self.verify_logs(logging.ERROR, msg='unexpected response')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 0
+        self.verify_logs(logging.ERROR, msg='unexpected response')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     @patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock)
@@ -501,65 +501,61 @@ class TestGraphQLRelated(TestCase):
         item_id = '3727501830'
         pub_url = 'https://psyche.co/ideas/are-successful-authors-creative-geniuses-or-literary-labourers'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedRightRail']) == 0
-            self.verify_logs(logging.ERROR, msg='unexpected response')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedRightRail']) == 0
+        self.verify_logs(logging.ERROR, msg='unexpected response')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     def test_related_after_article_fallback_cached(self):
         item_id = '3727699409'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=after_article_json(item_id)).json()
+        response = self.client.post("/", json=after_article_json(item_id)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 3
-            self.verify_logs(logging.INFO, method='scroll')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 3
+        self.verify_logs(logging.INFO, method='scroll')
 
-            with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
-                response = client.post("/", json=after_article_json(item_id)).json()
+        with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
+            response = self.client.post("/", json=after_article_json(item_id)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 3
-            self.verify_logs(logging.INFO, method='cache', msg='curated')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedAfterArticle']) == 3
+        self.verify_logs(logging.INFO, method='cache', msg='curated')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     def test_related_end_of_syndicated_fallback_cached(self):
         item_id = '3727511744'
         pub_url = 'https://time.com/6223012/workplaces-of-the-future/'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=syndicated_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=syndicated_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 3
-            self.verify_logs(logging.INFO, msg='scroll')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 3
+        self.verify_logs(logging.INFO, msg='scroll')
 
-            with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
-                response = client.post("/", json=syndicated_json(item_id, pub_url)).json()
+        with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
+            response = self.client.post("/", json=syndicated_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 3
-            self.verify_logs(logging.INFO, method='cache', msg='syndicated')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedEndOfArticle']) == 3
+        self.verify_logs(logging.INFO, method='cache', msg='syndicated')
 
     @patch.object(AsyncPointsApi, 'recommend_points', qdrant_error_mock)
     def test_related_right_rail_fallback_cached(self):
         item_id = '3727501830'
         pub_url = 'https://psyche.co/ideas/are-successful-authors-creative-geniuses-or-literary-labourers'
 
-        with TestClient(app) as client:
-            response = client.post("/", json=publisher_json(item_id, pub_url)).json()
+        response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedRightRail']) == 3
-            self.verify_logs(logging.INFO, msg='scroll')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedRightRail']) == 3
+        self.verify_logs(logging.INFO, msg='scroll')
 
-            with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
-                response = client.post("/", json=publisher_json(item_id, pub_url)).json()
+        with patch.object(AsyncPointsApi, 'scroll_points', qdrant_error_mock):
+            response = self.client.post("/", json=publisher_json(item_id, pub_url)).json()
 
-            assert not response.get('errors')
-            assert len(response['data']['_entities'][0]['relatedRightRail']) == 3
-            self.verify_logs(logging.INFO, method='cache', msg='publisher')
+        assert not response.get('errors')
+        assert len(response['data']['_entities'][0]['relatedRightRail']) == 3
+        self.verify_logs(logging.INFO, method='cache', msg='publisher')
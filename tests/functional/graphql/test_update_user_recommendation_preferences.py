@@ -44,7 +44,7 @@ class TestUpdateUserRecommendationPreferences(TestDynamoDBBase):
                     },
                 },
                 headers={
-                    'userId': str(self.request_user.user_id),
+                    'userId': self.request_user.str_user_id,
                     'encodedId': self.request_user.hashed_user_id,
                 }
             ).json()
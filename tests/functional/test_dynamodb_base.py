@@ -1,5 +1,5 @@
 import os
-from typing import Tuple
+from typing import ClassVar, Optional, Tuple
 
 import unittest
 import boto3
@@ -19,6 +19,9 @@ class TestDynamoDBBase(unittest.IsolatedAsyncioTestCase):
         'MODELD-Local-SlateMetrics',
     )
     dynamodb: DynamoDBServiceResource
+    # The resource (and its HTTP connection pool) is shared by all tests; constructing one per test opened a new
+    # pool every time.
+    _shared_dynamodb: ClassVar[Optional[DynamoDBServiceResource]] = None
     jsonRoot = os.path.join(ROOT_DIR, '.docker/localstack/dynamodb/')
     metadata_table: DynamoDBServiceResource.Table
     candidate_table: DynamoDBServiceResource.Table
@@ -26,14 +29,13 @@ class TestDynamoDBBase(unittest.IsolatedAsyncioTestCase):
     candidate_set_table: DynamoDBServiceResource.Table
 
     async def asyncSetUp(self):
-        self.dynamodb = boto3.resource('dynamodb', endpoint_url=dynamodb_config['endpoint_url'])
-        self.delete_tables()
+        if TestDynamoDBBase._shared_dynamodb is None:
+            TestDynamoDBBase._shared_dynamodb = boto3.resource(
+                'dynamodb', endpoint_url=dynamodb_config['endpoint_url'])
+        self.dynamodb = TestDynamoDBBase._shared_dynamodb
         self.create_tables()
         await reset_caches()
 
-    async def asyncTearDown(self):
-        self.delete_tables()
-
     async def clear_caches(self):
         await reset_caches()
 
@@ -60,12 +62,37 @@ class TestDynamoDBBase(unittest.IsolatedAsyncioTestCase):
         with open(table_schema) as f:
             table_schema_json = json.load(f)
 
-        table = self.dynamodb.create_table(**table_schema_json)
-        table.meta.client.get_waiter('table_exists').wait(TableName=table.name)
+        # Tables persist across tests: emptying an existing table is much cheaper than the delete/create/waiter
+        # round-trips to local DynamoDB that used to run for every test.
+        table = self.dynamodb.Table(table_schema_json['TableName'])
+        try:
+            table.load()
+        except self.dynamodb.meta.client.exceptions.ResourceNotFoundException:
+            table = self.dynamodb.create_table(**table_schema_json)
+            table.meta.client.get_waiter('table_exists').wait(TableName=table.name)
+        else:
+            self.truncate_table(table)
         assert table.table_status == 'ACTIVE'
 
         return table
 
+    @staticmethod
+    def truncate_table(table: DynamoDBServiceResource.Table):
+        key_names = [key['AttributeName'] for key in table.key_schema]
+        # Project only the key attributes, aliased because key names may collide with DynamoDB reserved words.
+        projection = ', '.join(f'#key{i}' for i in range(len(key_names)))
+        attribute_names = {f'#key{i}': name for i, name in enumerate(key_names)}
+
+        scan_kwargs = {'ProjectionExpression': projection, 'ExpressionAttributeNames': attribute_names}
+        with table.batch_writer() as batch:
+            while True:
+                scan = table.scan(**scan_kwargs)
+                for item in scan['Items']:
+                    batch.delete_item(Key=item)
+                if 'LastEvaluatedKey' not in scan:
+                    break
+                scan_kwargs['ExclusiveStartKey'] = scan['LastEvaluatedKey']
+
     def create_recommendation_api_metadata_table(self) -> DynamoDBServiceResource.Table:
         return self.create_table(self.jsonRoot + 'recommendation_api_metadata.json')
 
@@ -6,6 +6,7 @@ from app import config
 from app.data_providers.corpus.corpus_feature_group_client import CorpusFeatureGroupClient
 from app.data_providers.feature_group.corpus_engagement_provider import CorpusEngagementProvider
 from app.data_providers.topic_provider import TopicProvider
+from app.recommenders.item2item import Item2ItemRecommender
 
 
 def delete_caches():
@@ -38,6 +39,7 @@ async def clear_function_caches():
     """
     cached_functions = [
         TopicProvider._scan_table,
+        TopicProvider.get_topics,
         CorpusFeatureGroupClient._query_corpus_items,
         CorpusEngagementProvider._get_engagement_by_keys,
     ]
@@ -47,6 +49,25 @@ async def clear_function_caches():
         await f.cache.clear()
 
 
+async def clear_item2item_caches():
+    """
+    Clears the Item2ItemRecommender method caches, which are keyed on the recommender instance. Tests that share one
+    application lifespan (and thus one recommender instance) call this to stay independent of each other.
+    :return:
+    """
+    cached_functions = [
+        Item2ItemRecommender.by_publisher,
+        Item2ItemRecommender.syndicated,
+        Item2ItemRecommender.frequently_saved_curated,
+        Item2ItemRecommender.frequently_saved_syndicated,
+        Item2ItemRecommender.random_by_publisher,
+    ]
+
+    for f in cached_functions:
+        # The cache is available in the function object as ``<function_name>.cache``.
+        await f.cache.clear()
+
+
 async def reset_caches():
     await clear_memcache()
     await clear_function_caches()
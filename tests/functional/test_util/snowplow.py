@@ -1,6 +1,9 @@
 import asyncio
+from typing import Dict
 from urllib.parse import urljoin
 
+import httpx
+import pytest
 import requests
 
 from app.data_providers.snowplow.config import SnowplowConfig
@@ -11,20 +14,31 @@ class SnowplowMicroClient:
     Based on https://github.com/Pocket/curated-corpus-api/blob/main/src/test/helpers/snowplow.ts
     """
 
+    # The session is shared by all instances, such that its keep-alive connections to Snowplow Micro are reused
+    # across tests, even though a new client is constructed in every test setup.
+    _session = requests.Session()
+
     def __init__(self, config: SnowplowConfig):
         self.config = config
 
     def reset_snowplow_events(self):
-        return requests.post(self._format_url('/micro/reset')).json()
+        return self._session.post(self._format_url('/micro/reset')).json()
 
     def get_event_counts(self):
-        return requests.get(self._format_url('/micro/all')).json()
+        return self._session.get(self._format_url('/micro/all')).json()
+
+    async def get_event_counts_async(self, client: httpx.AsyncClient):
+        """
+        Async variant for use inside a running event loop, where the blocking requests call would stall other tasks.
+        :param client: An httpx client bound to the current event loop, so its keep-alive connections can be reused.
+        """
+        return (await client.get(self._format_url('/micro/all'))).json()
 
     def get_good_events(self):
-        return requests.get(self._format_url('/micro/good')).json()
+        return self._session.get(self._format_url('/micro/good')).json()
 
     def get_bad_snowplow_events(self):
-        return requests.get(self._format_url('/micro/bad')).json()
+        return self._session.get(self._format_url('/micro/bad')).json()
 
     def get_last_error(self):
         bad_events = self.get_bad_snowplow_events()
@@ -34,10 +48,28 @@ class SnowplowMicroClient:
         return urljoin(f'{self.config.PROTOCOL}://{self.config.ENDPOINT_URL}', url_path)
 
 
+def assert_event_counts(snowplow_micro, expected_counts: Dict):
+    """
+    Assert that Snowplow Micro's event counts equal expected_counts (e.g. {'total': 1, 'good': 1, 'bad': 0}).
+
+    On a mismatch the failure message includes the last Snowplow validation error. Fetching that error is an extra
+    HTTP request to Snowplow Micro, so it is deliberately only issued when the comparison fails; passing tests make
+    no additional call.
+    """
+    event_counts = snowplow_micro.get_event_counts()
+    if event_counts != expected_counts:
+        message = f'Snowplow event counts {event_counts} != expected {expected_counts}.'
+        if event_counts.get('bad'):
+            message += f' Last error: {snowplow_micro.get_last_error()}'
+        pytest.fail(message)
+
+
 async def wait_for_snowplow_events(snowplow_micro, max_wait_time: int = 5, n_expected_event: int = 1):
     # Locally the request to Snowplow gets handled in 0.01s, but in CircleCI we need 1 second.
-    for i in range(max_wait_time):
-        if snowplow_micro.get_event_counts()['total'] >= n_expected_event:
-            return
-        else:
-            await asyncio.sleep(1)
+    # One client serves all polls, and is created per call because each test runs on its own event loop.
+    async with httpx.AsyncClient() as client:
+        for i in range(max_wait_time):
+            if (await snowplow_micro.get_event_counts_async(client))['total'] >= n_expected_event:
+                return
+            else:
+                await asyncio.sleep(1)
@@ -79,6 +79,9 @@ class TestHomeDispatch:
     async def test_dedupe_and_limit(self):
         """
         Test that corpus recommendations are deduplicated across slates in the Home lineup.
+
+        The slate providers are started concurrently by HomeDispatch, so this also guards that deduplication and
+        slate order stay deterministic regardless of the order in which the slate tasks complete.
         """
         self.unleash_provider.get_assignments.return_value = [UnleashAssignmentModel(
             assigned=True, name='content_v1', variant='control'),
@@ -1,7 +1,11 @@
 import unittest
+from functools import lru_cache
+from typing import Sequence, Tuple
 
+import numpy as np
 import pytest
 from app.models.corpus_item_model import CorpusItemModel
+from app.models.recommendation import RecommendationModel
 
 from tests.assets.engagement_metrics import generate_metrics, generate_metrics_model_dict, \
     generate_corpus_engagement
@@ -16,13 +20,28 @@ ANDROID_DISCOVER_LINEUP_ID = "b50524d6-4df9-4f15-a0d0-13ccc8bdf4ed"
 WEB_HOME_LINEUP_ID = "05027beb-0053-4020-8bdc-4da2fcc0cb68"
 
 
+@lru_cache(maxsize=None)
+def _recommendation_templates(item_ids: Tuple) -> List[RecommendationModel]:
+    return generate_recommendations(list(item_ids))
+
+
+def cached_recommendations(item_ids: Sequence) -> List[RecommendationModel]:
+    """
+    The same few rec-list shapes are used by many tests in this module. Build each shape once and hand out pydantic
+    copies per call, because some tests mutate rec attributes (e.g. spread_publishers tests overwrite publisher).
+    A copy() is much cheaper than re-validating the models in generate_recommendations.
+    """
+    return [rec.copy() for rec in _recommendation_templates(tuple(item_ids))]
+
+
 class MockCorpusItems:
     @staticmethod
     def get_topics():
         return [business_topic, technology_topic, gaming_topic, health_topic, entertainment_topic]
 
     @staticmethod
-    def get_recs():
+    @lru_cache(maxsize=1)
+    def _recs_template():
         topics = MockCorpusItems.get_topics()
         # 5 topics x 3 articles
         recs = []
@@ -32,6 +51,12 @@ class MockCorpusItems:
 
         return recs
 
+    @staticmethod
+    def get_recs():
+        # The 15 models are validated once and cached; tests get a fresh list because some of them append or insert
+        # recs, while none of them mutate the items themselves.
+        return list(MockCorpusItems._recs_template())
+
     @staticmethod
     def get_syndicated_rec():
         return CorpusItemModel(
@@ -83,7 +108,7 @@ def test_rank_by_impression_caps(capped_corpus_items: List[CorpusItemModel]):
 
 class TestAlgorithmsSpreadPublishers(unittest.TestCase):
     def test_spread_publishers_single_reorder(self):
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
+        recs = cached_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
         recs[0].publisher = 'thedude.com'
         recs[1].publisher = 'walter.com'
         recs[2].publisher = 'donnie.com'
@@ -104,7 +129,7 @@ class TestAlgorithmsSpreadPublishers(unittest.TestCase):
         assert [x.item.item_id for x in reordered] == ['1', '2', '3', '5', '4', '6', '7', '8']
 
     def test_spread_publishers_multiple_reorder(self):
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
+        recs = cached_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
         recs[0].publisher = 'thedude.com'
         recs[1].publisher = 'walter.com'
         recs[2].publisher = 'walter.com'
@@ -125,7 +150,7 @@ class TestAlgorithmsSpreadPublishers(unittest.TestCase):
         assert [x.item.item_id for x in reordered] == ['1', '2', '5', '7', '4', '3', '6', '8']
 
     def test_spread_publishers_give_up_at_the_end(self):
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
+        recs = cached_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
         recs[0].publisher = 'thedude.com'
         recs[1].publisher = 'abides.com'
         recs[2].publisher = 'walter.com'
@@ -145,7 +170,7 @@ class TestAlgorithmsSpreadPublishers(unittest.TestCase):
 
     def test_spread_publishers_cannot_spread(self):
         """if we don't have enough variance in publishers, spread can't happen"""
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
+        recs = cached_recommendations([1, 2, 3, 4, 5, 6, 7, 8])
         recs[0].publisher = 'thedude.com'
         recs[1].publisher = 'abides.com'
         recs[2].publisher = 'donnie.com'
@@ -161,55 +186,30 @@ class TestAlgorithmsSpreadPublishers(unittest.TestCase):
         assert [x.item.item_id for x in reordered] == ['1', '2', '3', '4', '5', '6', '7', '8']
 
 
-class TestAlgorithmsTop5(unittest.TestCase):
-    def test_get_top_5_items(self):
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16])
-        top_5 = top5(recs)
-        assert [x.item.item_id for x in top_5] == ['1', '2', '3', '4', '5']
-
-    def test_get_all_items_when_less_than_5(self):
-        recs = generate_recommendations([1, 2])
-        top_5 = top5(recs)
-        assert [x.item.item_id for x in top_5] == ['1', '2']
-
-
-class TestAlgorithmsTop15(unittest.TestCase):
-    def test_get_top_15_items(self):
-        recs = generate_recommendations([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16])
-        top_15 = top15(recs)
-        assert [x.item.item_id for x in top_15] == ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13',
-                                                    '14', '15']
-
-    def test_get_all_items_when_less_than_15(self):
-        recs = generate_recommendations([1, 2])
-        top_15 = top15(recs)
-        assert [x.item.item_id for x in top_15] == ['1', '2']
-
+@pytest.mark.parametrize("top_n,n,item_ids", [
+    (top5, 5, list(range(1, 17))),
+    (top15, 15, list(range(1, 17))),
+    (top30, 30, list(range(1, 32))),
+])
+def test_top_n_items(top_n, n, item_ids):
+    recs = cached_recommendations(item_ids)
+    assert [x.item.item_id for x in top_n(recs)] == [str(i) for i in item_ids[:n]]
 
-class TestAlgorithmsTop30(unittest.TestCase):
-    def test_get_top_30_items(self):
-        recs = generate_recommendations(
-            [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25,
-             26, 27, 28, 29, 30, 31])
-        top_30 = top30(recs)
-        assert [x.item.item_id for x in top_30] == ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13',
-                                                    '14', '15', '16', '17', '18', '19', '20', '21', '22', '23', '24',
-                                                    '25', '26', '27', '28', '29', '30']
 
-    def test_get_all_items_when_less_than_30(self):
-        recs = generate_recommendations([1, 2])
-        top_30 = top30(recs)
-        assert [x.item.item_id for x in top_30] == ['1', '2']
+@pytest.mark.parametrize("top_n", [top5, top15, top30])
+def test_top_n_all_items_when_less_than_n(top_n):
+    recs = cached_recommendations([1, 2])
+    assert [x.item.item_id for x in top_n(recs)] == ['1', '2']
 
 
 class TestAlgorithmsBlocklist(unittest.TestCase):
     def test_block_item_using_blocklist_file(self):
-        recs = generate_recommendations([1, 2, 3203292423, 99, 999])
+        recs = cached_recommendations([1, 2, 3203292423, 99, 999])
         filtered = blocklist(recs)
         assert [x.item.item_id for x in filtered] == ['1', '2', '99', '999']
 
     def test_block_item_using_blocklist_param(self):
-        recs = generate_recommendations([1, 2, 33, 66, 99, 999])
+        recs = cached_recommendations([1, 2, 33, 66, 99, 999])
         filtered = blocklist(recs, blocklist=['2', '99'])
         assert [x.item.item_id for x in filtered] == ['1', '33', '66', '999']
 
@@ -217,7 +217,7 @@ class TestAlgorithmsBlocklist(unittest.TestCase):
 class TestAlgorithmsThompsonSampling:
 
     def test_it_can_rank_items_with_missing_metrics(self):
-        recs = generate_recommendations(['333', '999'])
+        recs = cached_recommendations(['333', '999'])
 
         metrics = generate_metrics_model_dict(
             id='home/999',
@@ -230,7 +230,7 @@ class TestAlgorithmsThompsonSampling:
         assert {item.item_id for item in sampled_recs} == {"999", "333"}
 
     def test_invalid_prior(self):
-        recs = generate_recommendations(['999'])
+        recs = cached_recommendations(['999'])
         metrics = generate_metrics_model_dict(
             id = 'home/default',
             trailing_28_day_opens=99,
@@ -249,7 +249,7 @@ class TestAlgorithmsThompsonSampling:
         # Invalid trailing_period
         with pytest.raises(ValueError):
             thompson_sampling(
-                generate_recommendations(['999']),
+                cached_recommendations(['999']),
                 metrics=generate_metrics_model_dict(),
                 trailing_period=123  # Model does not have 123 day trailing metrics
             )
@@ -269,19 +269,20 @@ class TestAlgorithmsThompsonSampling:
         :param ntrials is the number of trials for the aggregation
         """
 
-        recs = generate_recommendations(["333333", "666666", "999999", "222222"])
+        recs = cached_recommendations(["333333", "666666", "999999", "222222"])
 
         # goal of test is to rank by CTR over ntrials
         # order should be 999999, 666666, 333333
-        ranks = {}
+        item_index = {rec.item.item_id: i for i, rec in enumerate(recs)}
+        # Collect the positional rank of each item per trial in one array, and compute the average positional rank
+        # over the trials with a single mean(), instead of updating a dict for every rec in every trial.
+        positions = np.empty((ntrials, len(recs)), dtype=np.int16)
         for i in range(ntrials):
             sampled_recs = thompson_sampling_function(recs, metrics)
-            c = 1
-            for rec in sampled_recs:
-                # compute average positional rank over the trials
-                ranks[rec.item.item_id] = ranks.get(rec.item.item_id, 0) + (c / ntrials)
-                c += 1
+            for c, rec in enumerate(sampled_recs, start=1):
+                positions[i, item_index[rec.item.item_id]] = c
 
+        ranks = dict(zip(item_index, positions.mean(axis=0)))
         final_ranks = sorted(ranks.items(), key=itemgetter(1))
 
         assert final_ranks[0][0] == '999999'
@@ -1,4 +1,3 @@
-import random
 from typing import List
 from app.models.recommendation import RecommendationModel
 from app.models.item import ItemModel
@@ -9,15 +8,17 @@ ALL_CURATED_TOPICS_LINEUP = "55f5ed88-c7d9-48f9-bcf1-7ad214684ee9"
 
 def generate_recommendations(item_ids: List[int or str]) -> List[RecommendationModel]:
     recs = []
-    for item_id in item_ids:
+    for i, item_id in enumerate(item_ids):
+        # Derive ids from the item_id, like candidate_dict_to_recommendation does. The previous random ids could
+        # collide between recs, which would mask bugs in (and block) any ranker logic that keys recs by id.
         rec = RecommendationModel(
             item_id=item_id,
             item=ItemModel(item_id=item_id),
             rec_src='bowling',
-            feed_id=random.randint(0, 101),
-            id=random.randint(0, 101)
+            feed_id=i + 1,
+            id=f'RecommendationAPI/{item_id}'
         )
-        rec.feed_item_id = id
+        rec.feed_item_id = rec.id
         recs.append(rec)
 
     return recs